@@ -6,10 +6,10 @@ throughout the library.
 
 import argparse  # NOQA
 
-from .plugin import Plugin, OK, WARNING, CRITICAL, UNKNOWN  # NOQA
+from .plugin import Plugin  # NOQA
 from .range import Range  # NOQA
 from .response import Response  # NOQA
-from .status import Status  # NOQA
+from .status import Status, OK, WARNING, CRITICAL, UNKNOWN  # NOQA
 
 version = "1.0.0"
 """Current version of Pycinga"""
@@ -9,6 +9,12 @@ import re
 
 from .range import Range
 
+# Pattern which values for the performance data must match
+_VALUE_RE = re.compile(r"[-0-9.]+\Z")
+
+# Valid units of measure, compared case-insensitively
+_VALID_UOMS = frozenset(("", "s", "%", "b", "kb", "mb", "gb", "tb", "c"))
+
 
 class PerfData(object):
     """
@@ -17,6 +23,8 @@ class PerfData(object):
     is meant to ease the formation of performance data.
     """
 
+    __slots__ = ("label", "_value", "_uom", "_warn", "_crit", "_minval", "_maxval")
+
     def __init__(self, label, value, uom=None, warn=None, crit=None,
                  minval=None, maxval=None):
         """Creates a new object representing a single performance data
@@ -41,8 +49,11 @@ class PerfData(object):
           - `uom` (optional): Unit of measure. This must only be `%`, `s`
             for seconds, `c` for continous data, or a unit of bit space
             measurement ("b", "kb", etc.)
-          - `warn` (optional): Warning range for this metric.
-          - `crit` (optional): Critical range for this metric.
+          - `warn` (optional): Warning range for this metric. This may be
+            a range string, but passing an existing
+            :py:class:`~pycinga.range.Range` avoids parsing it again.
+          - `crit` (optional): Critical range for this metric. As with
+            `warn`, a :py:class:`~pycinga.range.Range` is preferred.
           - `minval` (optional): Minimum value possible for this metric,
             if one exists.
           - `maxval` (optional): Maximum value possible for this metric,
@@ -81,7 +92,15 @@ class PerfData(object):
 
     @warn.setter
     def warn(self, value):
-        if value is not None and not isinstance(value, Range):
+        # Already parsed ranges, such as the plugin's own options, are
+        # stored as they are.
+        if type(value) is Range:
+            self._warn = value
+            return
+
+        if isinstance(value, str):
+            value = Range.parse(value)
+        elif value is not None and not isinstance(value, Range):
             value = Range(value)
 
         self._warn = value
@@ -97,7 +116,15 @@ class PerfData(object):
 
     @crit.setter
     def crit(self, value):
-        if value is not None and not isinstance(value, Range):
+        # Already parsed ranges, such as the plugin's own options, are
+        # stored as they are.
+        if type(value) is Range:
+            self._crit = value
+            return
+
+        if isinstance(value, str):
+            value = Range.parse(value)
+        elif value is not None and not isinstance(value, Range):
             value = Range(value)
 
         self._crit = value
@@ -143,9 +170,14 @@ class PerfData(object):
 
     @uom.setter
     def uom(self, value):
-        valids = ["", "s", "%", "b", "kb", "mb", "gb", "tb", "c"]
-        if value is not None and not str(value).lower() in valids:
-            raise ValueError("uom must be in: %s" % valids)
+        # Units which are already lowercase need no conversion at all
+        if value is None or (isinstance(value, str) and value in _VALID_UOMS):
+            self._uom = value
+            return
+
+        uom = value.lower() if isinstance(value, str) else str(value).lower()
+        if uom not in _VALID_UOMS:
+            raise ValueError("uom must be in: %s" % sorted(_VALID_UOMS))
 
         self._uom = value
 
@@ -162,23 +194,29 @@ class PerfData(object):
         # Quotify the label
         label = self._quote_if_needed(self.label)
 
-        # Check for None in each and make it empty string if so
-        uom = self.uom or ""
-        warn = self.warn or ""
-        crit = self.crit or ""
-        minval = self.minval or ""
-        maxval = self.maxval or ""
+        # Check for None in each and make it empty string if so. The
+        # private attributes are read directly to skip the properties.
+        uom = self._uom or ""
+        warn = self._warn or ""
+        crit = self._crit or ""
+        minval = self._minval or ""
+        maxval = self._maxval or ""
 
         # Create the proper format and return it
-        return "%s=%s%s;%s;%s;%s;%s" % (label, self.value, uom, warn, crit, minval, maxval)
+        return f"{label}={self._value}{uom};{warn};{crit};{minval};{maxval}"
 
-    def _is_valid_value(self, value):
+    @staticmethod
+    def _is_valid_value(value):
         """
         Returns boolean noting whether a value is in the proper value
         format which certain values for the performance data must adhere to.
         """
-        value_format = re.compile(r"[-0-9.]+$")
-        return value is None or value_format.match(str(value))
+        # Plain ints always stringify to digits and an optional sign, so
+        # skip the string conversion for them.
+        if value is None or type(value) is int:
+            return True
+
+        return _VALUE_RE.match(str(value)) is not None
 
     def _quote_if_needed(self, value):
         """
@@ -5,20 +5,10 @@ which should be subclassed when creating new plugins.
 """
 
 from argparse import ArgumentError, ArgumentParser
-from copy import copy
-
-from six import with_metaclass
 
 from .range import Range, RangeValueError
 from .response import Response
-from .status import Status
-
-# Status constants which contain both the status text and the
-# exit status associated with them.
-OK = Status("OK", 0)
-WARNING = Status("WARN", 1)
-CRITICAL = Status("CRIT", 2)
-UNKNOWN = Status("UNKNOWN", 3)
+from .status import CRITICAL, OK, UNKNOWN, WARNING  # NOQA
 
 
 def check_pycinga_range(value):
@@ -26,7 +16,7 @@ def check_pycinga_range(value):
     This parses and returns the Icinga range value.
     """
     try:
-        return Range(value)
+        return Range.parse(value)
     except RangeValueError as e:
         raise ArgumentError("options %s: %s" % (value, e.message))
 
@@ -43,9 +33,8 @@ class PluginMeta(type):
         # Set the parents on the plugin by finding all the parsers and
         # setting them.
         parents = []
-        attrs_copy = copy(attrs)
 
-        for key, val in attrs_copy.items():
+        for key, val in list(attrs.items()):
             if isinstance(val, ArgumentParser):
                 # We set the destination of the Action to always be the
                 # attribute key...
@@ -59,18 +48,19 @@ class PluginMeta(type):
         # Need to iterate through the bases in order to extract the
         # list of parent options, so we can inherit those.
         for base in bases:
-            if hasattr(base, "_parents"):
-                parents.extend(getattr(base, "_parents"))
+            parents.extend(getattr(base, "_parents", ()))
 
-        # Store the parent list and create the option parser
+        # Store the parent list. The option parser itself is only created
+        # once the plugin first parses its options, so that defining (or
+        # importing) plugins which are never run costs nothing.
         attrs["_parents"] = parents
-        attrs["_option_parser"] = ArgumentParser(parents=parents)
+        attrs["_option_parser"] = None
 
         # Create the class
         return super(PluginMeta, cls).__new__(cls, name, bases, attrs)
 
 
-class Plugin(with_metaclass(PluginMeta, object)):
+class Plugin(object, metaclass=PluginMeta):
     """
     Encapsulates a single plugin. This is able to parse the command line
     arguments, understands the range syntax, provides help output, and
@@ -86,13 +76,22 @@ class Plugin(with_metaclass(PluginMeta, object)):
 
     # TODO: Still missing version
 
-    responses = []
     _options = None
 
+    @classmethod
+    def _get_option_parser(cls):
+        """
+        Returns the option parser for this plugin class, creating it from
+        the gathered parent parsers on first use.
+        """
+        if cls._option_parser is None:
+            cls._option_parser = ArgumentParser(parents=cls._parents)
+        return cls._option_parser
+
     @property
     def options(self):
         if self._options is None:
-            self._options = self._option_parser.parse_args(self.args)
+            self._options = self._get_option_parser().parse_args(self.args)
         return self._options
 
     def __init__(self, args=None):
@@ -134,6 +133,7 @@ class Plugin(with_metaclass(PluginMeta, object)):
         """
         # Parse the given arguments to set the options
         self.args = args
+        self.responses = []
 
     def check(self):
         """
@@ -159,10 +159,16 @@ class Plugin(with_metaclass(PluginMeta, object)):
         trivial to calculate the value, grab a response, set some performance
         metrics, and return it.
         """
+        # Look the ranges up once; the options property and the namespace
+        # lookups are otherwise repeated for every check.
+        options = self.options
+        critical = getattr(options, "critical", None)
+        warning = getattr(options, "warning", None)
+
         status = OK
-        if getattr(self.options, "critical", None) and self.options.critical.in_range(value):
+        if critical is not None and critical.in_range(value):
             status = CRITICAL
-        elif getattr(self.options, "warning", None) and self.options.warning.in_range(value):
+        elif warning is not None and warning.in_range(value):
             status = WARNING
 
         return Response(status, message=message)
@@ -191,19 +197,27 @@ class Plugin(with_metaclass(PluginMeta, object)):
             else:
                 return Response(OK)
 
-        self.responses.sort(reverse=True, key=lambda k: k.status)
+        # A lone response is returned as it is, message or not
+        if len(self.responses) == 1:
+            resp = self.responses[0]
+            return Response(resp.status, resp.message)
 
-        worst = self.responses[0]
-        status = worst.status
-        message = worst.message
+        # Group the messages by status in a single pass, keeping the
+        # order in which the responses were added within each group.
+        groups = {}
+        for resp in self.responses:
+            groups.setdefault(resp.status, []).append(resp.message)
 
-        laststatus = status
+        # Only the groups need sorting, worst status first
+        statuses = sorted(groups, reverse=True)
 
-        for resp in self.responses[1:]:
-            if laststatus is not resp.status:
-                message += " " + resp.status.name + ": " + resp.message
-                laststatus = resp.status
-            else:
-                message += ", " + resp.message
+        # Build up the message fragments and join them once at the end,
+        # rather than repeatedly concatenating onto the message.
+        status = statuses[0]
+        parts = [", ".join(groups[status])]
+
+        for group_status in statuses[1:]:
+            parts.append(f" {group_status.name}: ")
+            parts.append(", ".join(groups[group_status]))
 
-        return Response(status, message)
+        return Response(status, "".join(parts))
@@ -3,6 +3,12 @@ Contains a class to represent a range that adheres to the range
 format defined by Icinga.
 """
 
+from functools import lru_cache
+
+# Infinity values used for "~" and omitted range ends
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
 
 class RangeValueError(ValueError):
     """
@@ -25,8 +31,12 @@ class Range(object):
       ~:10 - > 10 (~ = -inf)
       10:~ - < 10
 
+    Ranges are immutable once created, and compare equal when they match
+    the same values.
     """
 
+    __slots__ = ("inclusive", "start", "end", "_str_cache")
+
     def __init__(self, value):
         """
         Initializes an Icinga range with the given value. The value should be
@@ -57,55 +67,108 @@ class Range(object):
             raise RangeValueError("Range must not be empty")
 
         # Test for the inclusivity marked by the "@" symbol at the beginning
-        if value.startswith("@"):
-            self.inclusive = True
+        inclusive = value.startswith("@")
+        if inclusive:
             value = value[1:]
+
+        # The common form is a single end value (e.g. "10"), in which case
+        # the start is assumed to be 0 and there is nothing to split.
+        if ":" not in value:
+            start = 0.0
+            end_value = value
         else:
-            self.inclusive = False
-
-        # Split by the ":" character to get the start/end parts.
-        parts = value.split(":")
-        if len(parts) > 2:
-            raise RangeValueError("Range cannot have more than two parts.")
-        if len(parts) == 1:
-            parts.insert(0, "0")
-
-        # Parse the start value. If no ":" is included in value (e.g. "10")
-        # then the start is assumed to be 0. Otherwise, it is an integer
-        # value which can possibly be infinity.
-        try:
-            if parts[0] == "~":
-                start = float("-inf")
+            # Split by the ":" character to get the start/end parts.
+            parts = value.split(":", 2)
+            if len(parts) > 2:
+                raise RangeValueError("Range cannot have more than two parts.")
+            start_value, end_value = parts
+
+            # Parse the start value, which can possibly be negative infinity.
+            if start_value == "~":
+                start = _NEG_INF
             else:
-                start = float(parts[0])
-        except ValueError:
-            raise RangeValueError("invalid start value: %s" % parts[0])
+                try:
+                    start = float(start_value)
+                except ValueError:
+                    raise RangeValueError("invalid start value: %s" % start_value)
 
         # Parse the end value, which can be positive infinity.
-        try:
-            if parts[1] == "" or parts[1] == "~":
-                end = float("inf")
-            else:
-                end = float(parts[1])
-        except ValueError:
-            raise RangeValueError("invalid end value: %s" % parts[1])
+        if end_value == "" or end_value == "~":
+            end = _POS_INF
+        else:
+            try:
+                end = float(end_value)
+            except ValueError:
+                raise RangeValueError("invalid end value: %s" % end_value)
 
         # The start must be less than the end
         if start > end:
             raise RangeValueError("start must be less than or equal to end")
 
-        # Set the instance variables
-        self.start = start
-        self.end = end
+        # Set the instance variables, bypassing the immutability guard
+        set_attr = object.__setattr__
+        set_attr(self, "inclusive", inclusive)
+        set_attr(self, "start", start)
+        set_attr(self, "end", end)
+        set_attr(self, "_str_cache", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Range objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Range objects are immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        """
+        Returns the values which determine which values this range matches.
+        """
+        return (self.start, self.end, self.inclusive)
+
+    def __reduce__(self):
+        return (type(self), (str(self),))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def parse(cls, value):
+        """
+        Returns a range for the given range string, reusing a previously
+        parsed instance if the same string has been seen before. This is
+        safe because ranges are immutable.
+        """
+        return cls(value)
 
     def in_range(self, value):
         """
         Tests whether ``value`` is in this range.
+
+        Inclusive ranges match values between ``start`` and ``end``, while
+        exclusive ranges match values outside of them. Infinite bounds compare
+        correctly against any number, and NaN is never in a range.
         """
         if self.inclusive:
-            return value >= self.start and value <= self.end
-        else:
-            return value < self.start or value > self.end
+            return self.start <= value <= self.end
+        return value < self.start or value > self.end
+
+    def in_range_many(self, values):
+        """
+        Tests each value in the iterable ``values`` against this range,
+        returning a list of booleans in the same order. This is equivalent
+        to calling :py:func:`in_range` for every value, but avoids the
+        per-call overhead when checking a large batch of values.
+        """
+        start = self.start
+        end = self.end
+        if self.inclusive:
+            return [start <= value <= end for value in values]
+        return [value < start or value > end for value in values]
 
     def __str__(self):
         """
@@ -122,7 +185,13 @@ class Range(object):
           >> str(Range("@10:20")) == "@10:20"
           >> str(Range("10")) == "10"
           >> str(Range("10:")) == "10:~"
+
+        Since ranges are immutable, the string is only built the first time
+        and cached on the instance.
         """
+        if self._str_cache is not None:
+            return self._str_cache
+
         result = "@" if self.inclusive else ""
 
         # Setup some proxy variables since typing `self` all the time is tiring
@@ -131,17 +200,18 @@ class Range(object):
 
         # Only put start in the result if it is not equal to 0, since
         # it can otherwise be omitted
-        if start == float("-inf"):
+        if start == _NEG_INF:
             result += "~:"
         elif start != 0.0:
             value = int(start) if start.is_integer() else start
             result += str(value) + ":"
 
         # Append the end value next
-        if end == float("inf"):
+        if end == _POS_INF:
             result += "~"
         else:
             value = int(end) if end.is_integer() else end
             result += str(value)
 
+        object.__setattr__(self, "_str_cache", result)
         return result
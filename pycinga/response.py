@@ -4,7 +4,6 @@ encapsulates the response format that Icinga expects.
 """
 
 import sys
-from collections import OrderedDict
 
 from .perf_data import PerfData
 
@@ -16,6 +15,8 @@ class Response(object):
     providing helpers which make emitting this format simple.
     """
 
+    __slots__ = ("status", "message", "perf_data")
+
     def __init__(self, status=None, message=None):
         """
         Icinga responses are expected to be in a very specific format, and
@@ -33,7 +34,7 @@ class Response(object):
         """
         self.status = status
         self.message = message
-        self.perf_data = OrderedDict()
+        self.perf_data = {}
 
     def set_perf_data(self, label, value, uom=None, warn=None, crit=None,
                       minval=None, maxval=None):
@@ -55,9 +56,22 @@ class Response(object):
     def exit(self):
         """
         This prints out the response to ``stdout`` and exits with the
-        proper exit code.
+        proper exit code. The output is always encoded as UTF-8, regardless
+        of the encoding of ``stdout``.
         """
-        print(str(self).encode("utf-8"))
+        output = str(self) + "\n"
+
+        # Write UTF-8 directly to the underlying binary buffer when there is
+        # one, flushing the text layer first to keep earlier output in order.
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            sys.stdout.flush()
+            buffer.write(output.encode("utf-8"))
+            buffer.flush()
+        else:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+
         sys.exit(self.status.exit_code)
 
     def __str__(self):
@@ -83,7 +97,6 @@ class Response(object):
 
         if len(self.perf_data) > 0:
             # Attach the performance data to the result
-            data = [str(val) for key, val in self.perf_data.items()]
-            result += "|%s" % (" ".join(data))
+            result += "|" + " ".join(str(val) for val in self.perf_data.values())
 
         return result
@@ -1,43 +1,86 @@
 """
 This module provides the Status class, which encapsulates
-a status code for Icinga.
+a status code for Icinga, along with the standard statuses.
 """
 
+from functools import total_ordering
 
+# Standard statuses by exit code, filled in once they are created below
+_STATUS_BY_CODE = {}
+
+
+@total_ordering
 class Status(object):
     """
     Encapsulates an Icinga status, which holds a name and
     an exit code.
     """
 
-    def __init__(self, name, exit_code):
+    __slots__ = ("name", "exit_code")
+
+    def __new__(cls, name, exit_code):
         """
         Creates a new status object for Icinga with the given name and
-        exit code.
+        exit code. Statuses are immutable once created.
 
         **Note**: In general, this should never be called since the standard
-        statuses are exported from ``pycinga``.
+        statuses are exported from ``pycinga``. Creating a status with the
+        same name and exit code as a standard status returns that status.
         """
 
         if not isinstance(exit_code, int):
-            raise ValueError("exit_code must be an int, not %s" % type(exit_code))
+            raise TypeError(f"exit_code must be an int, not {type(exit_code).__name__}")
         if not isinstance(name, str):
-            raise ValueError("name must be a str, not %s" % type(exit_code))
+            raise TypeError(f"name must be a str, not {type(name).__name__}")
+
+        # Hand back the standard status if this is one, so that statuses
+        # can always be compared by identity.
+        if cls is Status and type(exit_code) is int:
+            status = _STATUS_BY_CODE.get(exit_code)
+            if status is not None and status.name == name:
+                return status
+
+        self = super(Status, cls).__new__(cls)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "exit_code", exit_code)
+        return self
 
-        self.name = name
-        self.exit_code = exit_code
+    def __setattr__(self, name, value):
+        raise AttributeError("Status objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Status objects are immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.name, self.exit_code))
 
     def __repr__(self):
-        return "Status(name=%s, exit_code=%d)" % (repr(self.name), self.exit_code)
+        return f"Status(name={self.name!r}, exit_code={self.exit_code})"
 
     def __lt__(self, other):
+        if not isinstance(other, Status):
+            return NotImplemented
         return (self.exit_code < other.exit_code)
 
     def __eq__(self, other):
+        if not isinstance(other, Status):
+            return NotImplemented
         return (self.exit_code == other.exit_code)
 
-    def __ne__(self, other):
-        return (self.exit_code != other.exit_code)
+    def __hash__(self):
+        return hash(self.exit_code)
+
+
+# Status constants which contain both the status text and the
+# exit status associated with them.
+OK = Status("OK", 0)
+WARNING = Status("WARN", 1)
+CRITICAL = Status("CRIT", 2)
+UNKNOWN = Status("UNKNOWN", 3)
 
-    def __gt__(self, other):
-        return (self.exit_code > other.exit_code)
+_STATUS_BY_CODE.update({
+    OK.exit_code: OK,
+    WARNING.exit_code: WARNING,
+    CRITICAL.exit_code: CRITICAL,
+    UNKNOWN.exit_code: UNKNOWN,
+})
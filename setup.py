@@ -20,12 +20,15 @@ setup(
     license="MIT License",
     keywords=["nagios", "pynagios", "icinga", "pycinga", "monitoring"],
     packages=["pycinga"],
+    python_requires=">=3.7",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: System Administrators",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "Topic :: System :: Systems Administration"
     ]
 )
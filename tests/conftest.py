@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the pycinga tests.
+"""
+
+import pytest
+
+from pycinga import Plugin
+from pycinga.perf_data import PerfData
+
+
+@pytest.fixture
+def make_plugin(request):
+    """
+    Returns a factory which creates a plugin from the given command line
+    arguments. Plugins are reused for the same arguments within a test, so
+    this should only be used by tests which do not add responses or
+    otherwise change the plugin. The plugin class is taken from the test
+    class's ``Klass`` attribute, if it has one.
+    """
+    klass = getattr(request.cls, "Klass", Plugin)
+    cache = {}
+
+    def _make_plugin(*args):
+        if args not in cache:
+            cache[args] = klass(list(args))
+        return cache[args]
+
+    return _make_plugin
+
+
+@pytest.fixture(scope="session")
+def basic_perf():
+    """
+    Returns performance data with only a label and value. This is shared by
+    the whole session, so tests must not modify it.
+    """
+    return PerfData("foo", "7")
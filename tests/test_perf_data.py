@@ -8,124 +8,99 @@ from pycinga.perf_data import PerfData
 from pycinga.range import Range
 
 
-class TestPerfData(object):
-
-    def test_exception_if_value_invalid(self):
-        """
-        Tests to verify that an exception is raised if value
-        is an invalid format.
-        """
-        with pytest.raises(ValueError):
-            PerfData("foo", "bar")
-
-    def test_exception_if_minval_invalid(self):
-        """
-        Tests to verify that an exception is raised if minval
-        is an invalid format.
+class TestPerfDataValidation(object):
+    pytestmark = pytest.mark.validation
+
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"label": "foo", "value": "bar"}, id="value"),
+        pytest.param({"label": "foo", "value": "7\n"}, id="value-trailing-newline"),
+        pytest.param({"label": "foo", "value": float("inf")}, id="value-infinite"),
+        pytest.param({"label": "foo", "value": "7", "minval": "foo"}, id="minval"),
+        pytest.param({"label": "foo", "value": "7", "maxval": "foo"}, id="maxval"),
+        pytest.param({"label": "foo", "value": "7", "warn": "boo"}, id="warn"),
+        pytest.param({"label": "foo", "value": "7", "crit": "boo"}, id="crit"),
+    ])
+    def test_invalid_perfdata(self, kwargs):
+        """
+        Tests to verify that an exception is raised if the value,
+        minval, maxval, or warning or critical range is an invalid
+        format.
         """
         with pytest.raises(ValueError):
-            PerfData("foo", "7", minval="foo")
+            PerfData(**kwargs)
 
-    def test_exception_if_maxval_invalid(self):
-        """
-        Tests to verify that an exception is raised if maxval
-        is an invalid format.
-        """
-        with pytest.raises(ValueError):
-            PerfData("foo", "7", maxval="foo")
-
-    def test_exception_if_invalid_uom(self):
+    @pytest.mark.parametrize("uom", ["p", "bytes", "nope"])
+    def test_exception_if_invalid_uom(self, uom):
         """
         Tests to verify that an exception is raised if the
         unit of measure is an invalid format.
         """
-        invalids = ["p", "bytes", "nope"]
-        for value in invalids:
-            with pytest.raises(ValueError):
-                PerfData("foo", "7", uom=value)
+        with pytest.raises(ValueError):
+            PerfData("foo", "7", uom=uom)
 
-    def test_setting_valid_uom(self):
+    @pytest.mark.parametrize("uom", [None, "", "s", "%", "B", "KB", "MB", "GB", "TB", "c"])
+    def test_setting_valid_uom(self, uom):
         """
         Tests to verify that an exception is not raised if the
         unit of measure is a valid format.
         """
-        valids = [None, "", "s", "%", "B", "KB", "MB", "GB", "TB", "c"]
-        for value in valids:
-            PerfData("foo", "7", uom=value)
+        assert uom == PerfData("foo", "7", uom=uom).uom
 
-    def test_invalid_warn_range(self):
+    @pytest.mark.parametrize("field", ["warn", "crit"])
+    @pytest.mark.parametrize("value", [
+        pytest.param("10:20", id="string"),
+        pytest.param(Range.parse("10:20"), id="range"),
+    ])
+    def test_valid_range(self, field, value):
         """
-        Tests to verify that an exception is raised if the warning
-        range is invalid.
+        Tests to verify that warn and crit ranges can be set to a
+        range object, and are converted to one if a string is given.
         """
-        with pytest.raises(ValueError):
-            PerfData("foo", "7", warn="boo")
+        instance = PerfData("foo", "7", **{field: value})
+        result = getattr(instance, field)
+        assert isinstance(result, Range)
+        assert 10.0 == result.start
+        assert 20.0 == result.end
+        if isinstance(value, Range):
+            assert value is result
 
-    def test_invalid_crit_range(self):
-        """
-        Tests to verify that an exception is raised if the crit
-        range is invalid.
-        """
-        with pytest.raises(ValueError):
-            PerfData("foo", "7", crit="boo")
 
-    def test_valid_warn_range_as_string(self):
-        """
-        Tests to verify that warnings are converted to range
-        object if a string is given.
-        """
-        instance = PerfData("foo", "7", warn="10:20")
-        assert isinstance(instance.warn, Range)
-        assert 10.0 == instance.warn.start
-        assert 20.0 == instance.warn.end
+class TestPerfDataFormat(object):
+    pytestmark = pytest.mark.formatting
 
-    def test_valid_crit_range_as_string(self):
+    def test_numeric_values(self):
         """
-        Tests to verify that crit range is converted to range
-        object if a string is given.
+        Tests to verify that ints and floats are accepted as values.
         """
-        instance = PerfData("foo", "7", crit="10:20")
-        assert isinstance(instance.crit, Range)
-        assert 10.0 == instance.crit.start
-        assert 20.0 == instance.crit.end
+        assert "foo=-7;;;;" == str(PerfData("foo", -7))
+        assert "foo=7.5;;;;" == str(PerfData("foo", 7.5))
 
-    def test_valid_warn_range_as_range(self):
+    def test_uom_keeps_case(self):
         """
-        Tests to verify that warning range can be set to range object.
+        Tests to verify that the unit of measure is output with the
+        case it was given in.
         """
-        value = Range("10:20")
-        instance = PerfData("foo", "7", warn=value)
-        assert value == instance.warn
+        assert "foo=7MB;;;;" == str(PerfData("foo", "7", uom="MB"))
+        assert "foo=7kb;;;;" == str(PerfData("foo", "7", uom="kb"))
 
-    def test_valid_crit_range_as_range(self):
-        """
-        Tests to verify that crit range can be set to range object.
-        """
-        value = Range("10:20")
-        instance = PerfData("foo", "7", crit=value)
-        assert value == instance.crit
-
-    def test_valid_string(self):
+    def test_valid_string(self, basic_perf):
         """
         Tests to verify that a valid string representation is
         returned for a basic case of only having a label and
         value.
         """
-        instance = PerfData("foo", "7")
-        assert "foo=7;;;;" == str(instance)
+        assert "foo=7;;;;" == str(basic_perf)
 
-    def test_quote_label(self):
+    @pytest.mark.parametrize("label,expected", [
+        ("with=", "'with='=7;;;;"),
+        ("I have spaces", "'I have spaces'=7;;;;"),
+        ("quote'", "'quote'''=7;;;;"),
+    ])
+    def test_quote_label(self, label, expected):
         """
         Tests to verify that the label is quoted if it needs to be.
         """
-        instance = PerfData("with=", "7")
-        assert "'with='=7;;;;" == str(instance)
-
-        instance = PerfData("I have spaces", "7")
-        assert "'I have spaces'=7;;;;" == str(instance)
-
-        instance = PerfData("quote'", "7")
-        assert "'quote'''=7;;;;" == str(instance)
+        assert expected == str(PerfData(label, "7"))
 
     def test_include_other_values(self):
         """
@@ -7,8 +7,21 @@ from argparse import ArgumentError, ArgumentParser
 
 import pytest
 
-import pycinga  # NOQA: I100
-from pycinga import Plugin, Range, Response
+from pycinga import CRITICAL, OK, Plugin, Range, Response, UNKNOWN, WARNING  # NOQA: I100
+
+# Responses are only read when collated, so they can be shared by the tests
+_R1 = Response(OK, "foo")
+_R2 = Response(CRITICAL, "bar")
+_R3 = Response(OK, "baz")
+
+
+class _ConflictingPlugin(Plugin):
+    """
+    Plugin whose options conflict with the standard ones. Defining it is
+    cheap since the option parser is only built when options are parsed.
+    """
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument("-H", type=str)
 
 
 class TestPlugin(object):
@@ -25,74 +38,62 @@ class TestPlugin(object):
         plugin = MyChild(["-H", "foo.com"])
         assert "foo.com" == plugin.options.hostname
 
+    def test_option_parser_is_per_class(self):
+        """
+        Tests that the option parser is created lazily and separately
+        for each plugin class.
+        """
+        class MyChild(Plugin):
+            parser = ArgumentParser(add_help=False)
+            parser.add_argument("--foo", type=str)
+
+        assert MyChild._option_parser is None
+
+        plugin = MyChild(["--foo", "bar"])
+        assert "bar" == plugin.options.foo
+        assert MyChild._option_parser is not None
+        assert MyChild._option_parser is not Plugin._get_option_parser()
+
     def test_conflicting_options_explode(self):
         """
-        Tests that conflicting options will raise an exception.
+        Tests that conflicting options will raise an exception once
+        the plugin parses its options.
         """
         with pytest.raises(ArgumentError):
-            class MyChild(Plugin):
-                parser = ArgumentParser(add_help=False)
-                parser.add_argument("-H", type=str)
+            _ConflictingPlugin([]).options
 
     def test_plugin_parses_sys_argv(self, monkeypatch):
         """
         Tests that plugins by default parse the passed in
         arguments.
         """
-        # Update the argv in-place since the default arguments
-        # are evaluated at "compile" time of Python
-        if len(sys.argv) > 1:
-            del sys.argv[1:]
-        sys.argv.extend(["-H", "foo.com"])
+        monkeypatch.setattr(sys, "argv", ["pytest", "-H", "foo.com"])
 
         plugin = self.Klass()
         assert "foo.com" == plugin.options.hostname
 
-    def test_plugin_parses_hostname(self):
-        """
-        Tests that plugins properly parse the hostname option.
-        """
-        plugin = self.Klass(["-H", "foo.com"])
-        assert "foo.com" == plugin.options.hostname
-
-    def test_plugin_parses_warning_range(self):
-        """
-        Tests that plugins can properly parse warning ranges from
-        the command line via the "-w" option.
-        """
-        plugin = self.Klass(["-w", "10:20"])
-        assert isinstance(plugin.options.warning, Range)
-        assert 10.0 == plugin.options.warning.start
-        assert 20.0 == plugin.options.warning.end
-
-    def test_plugin_parses_critical_range(self):
-        """
-        Tests that plugins can properly parse critical ranges
-        from the command line via the "-c" option.
-        """
-        plugin = self.Klass(["-c", "10:20"])
-        assert isinstance(plugin.options.critical, Range)
-
-    def test_plugin_parses_timeout(self):
-        """
-        Tests that plugins can properly parse timeout
-        from the command line via the "-t" option.
-        """
-        plugin = self.Klass(["-t", "17"])
-        assert 17 == plugin.options.timeout
-
-    def test_plugin_parses_verbosity(self):
-        """
-        Tests that plugins can properly parse verbosity.
-        """
-        plugin = self.Klass(["-v"])
-        assert 1 == plugin.options.verbosity
-
-        plugin = self.Klass(["-vv"])
-        assert 2 == plugin.options.verbosity
-
-        plugin = self.Klass(["-vvv"])
-        assert 3 == plugin.options.verbosity
+    @pytest.mark.parametrize("argv,attr,expected", [
+        (["-H", "foo.com"], "hostname", "foo.com"),
+        (["-w", "10:20"], "warning", Range("10:20")),
+        (["-c", "10:20"], "critical", Range("10:20")),
+        (["-t", "17"], "timeout", 17),
+        (["-v"], "verbosity", 1),
+        (["-vv"], "verbosity", 2),
+        (["-vvv"], "verbosity", 3),
+    ], ids=["hostname", "warning", "critical", "timeout", "verbosity-1", "verbosity-2",
+            "verbosity-3"])
+    def test_plugin_option(self, make_plugin, argv, attr, expected):
+        """
+        Tests that plugins properly parse the standard options, such
+        as the hostname via "-H" and ranges via "-w" and "-c".
+        """
+        plugin = make_plugin(*argv)
+        value = getattr(plugin.options, attr)
+        assert expected == value
+        if isinstance(expected, Range):
+            assert 10.0 == value.start
+            assert 20.0 == value.end
+            assert not value.inclusive
 
     def test_plugin_errors_on_check(self):
         """
@@ -102,54 +103,73 @@ class TestPlugin(object):
         with pytest.raises(NotImplementedError):
             Plugin([]).check()
 
-    def test_plugin_can_return_response_for_value(self):
+    def test_plugin_can_return_response_for_value(self, make_plugin):
         """
         Tests that the plugin can return a proper response for the given
         value.
         """
-        plugin = self.Klass(["-w", "10:20", "-c", "0:40"])
-        assert pycinga.OK == plugin.response_for_value(15).status
-        assert pycinga.WARNING == plugin.response_for_value(27).status
-        assert pycinga.CRITICAL == plugin.response_for_value(50).status
+        plugin = make_plugin("-w", "10:20", "-c", "0:40")
+        assert OK == plugin.response_for_value(15).status
+        assert WARNING == plugin.response_for_value(27).status
+        assert CRITICAL == plugin.response_for_value(50).status
 
-    def test_plugin_can_set_message_on_response_for_value(self):
+    def test_plugin_can_set_message_on_response_for_value(self, make_plugin):
         """
         Tests that plugins can set a message when getting a response for
         a given value.
         """
-        plugin = self.Klass(["-w", "10:20", "-c", "0:40"])
+        plugin = make_plugin("-w", "10:20", "-c", "0:40")
         assert "foo!" == plugin.response_for_value(15, "foo!").message
 
-    def test_warning_is_optional(self):
+    def test_warning_is_optional(self, make_plugin):
         """
         Tests that if warning and critical are not set on the command line
         then the response is OK.
         """
-        plugin = self.Klass([])
-        assert pycinga.OK == plugin.response_for_value(15).status
+        plugin = make_plugin()
+        assert OK == plugin.response_for_value(15).status
 
-    def test_multiple_responses_default(self):
+    def test_multiple_responses(self):
         """
-        Test that the default parameter to all_responses is working
+        Test that the add_response and all_responses mechanism is working,
+        including the default used before any responses are added.
         """
+        plugin = self.Klass()
+        assert OK == plugin.all_responses().status
+
+        default = Response(UNKNOWN, "default test")
+        result = plugin.all_responses(default)
+        assert default.status == result.status
+        assert default.message == result.message
+
+        plugin.add_response(_R1)
+        plugin.add_response(_R2)
+        plugin.add_response(_R3)
+
+        result = plugin.all_responses(default)
+        assert CRITICAL == result.status
+        assert "bar OK: foo, baz" == result.message
 
+    def test_single_response_without_message(self):
+        """
+        Test that a single response without a message is collated into
+        a response with the same status and no message.
+        """
         plugin = self.Klass()
-        assert pycinga.OK == plugin.all_responses().status
+        plugin.add_response(Response(WARNING))
 
-        r1 = Response(pycinga.UNKNOWN, "default test")
-        assert r1.status == plugin.all_responses(r1).status
-        assert r1.message == plugin.all_responses(r1).message
+        result = plugin.all_responses()
+        assert WARNING == result.status
+        assert result.message is None
 
-    def test_multiple_responses(self):
+    def test_responses_are_not_shared(self):
         """
-        Test that the add_response and all_responses mechanism is working
+        Test that responses added to one plugin do not show up on
+        another plugin instance.
         """
         plugin = self.Klass()
-        r1 = Response(pycinga.OK, "foo")
-        r2 = Response(pycinga.CRITICAL, "bar")
-        r3 = Response(pycinga.OK, "baz")
-        plugin.add_response(r1)
-        plugin.add_response(r2)
-        plugin.add_response(r3)
-        assert pycinga.CRITICAL == plugin.all_responses().status
-        assert "bar OK: foo, baz" == plugin.all_responses().message
+        plugin.add_response(_R2)
+
+        other = self.Klass()
+        assert [] == other.responses
+        assert OK == other.all_responses().status
@@ -3,47 +3,44 @@ Contains tests to test the Range class, which is responsible for
 parsing and storing the values of an Icinga range format.
 """
 
+import copy
+import math
+import pickle
+
 import pytest
 
 from pycinga.range import Range, RangeValueError
 
+INF = math.inf
+NEG_INF = -math.inf
 
-class TestRangeParsing(object):
 
-    def test_range_with_empty(self):
-        """
-        Tests empty ranges should throw an error.
-        """
-        with pytest.raises(RangeValueError):
-            Range("")
+@pytest.fixture(scope="module")
+def inclusive_range():
+    return Range.parse("@10:20")
 
-    def test_range_with_too_many_values(self):
-        """
-        Tests ranges with too many values throws an error.
-        """
-        with pytest.raises(RangeValueError):
-            Range("10:20:30")
 
-    def test_range_with_empty_start(self):
-        """
-        Tests ranges with an empty start value.
-        """
-        with pytest.raises(RangeValueError):
-            Range(":10")
+@pytest.fixture(scope="module")
+def exclusive_range():
+    return Range.parse("10:20")
 
-    def test_range_with_bad_start(self):
-        """
-        Tests ranges with a bad start value are invalid.
-        """
-        with pytest.raises(RangeValueError):
-            Range("bad:10")
 
-    def test_range_with_bad_end(self):
+class TestRangeParsing(object):
+
+    @pytest.mark.parametrize("bad", [
+        pytest.param("", id="empty"),
+        pytest.param("10:20:30", id="too-many-values"),
+        pytest.param(":10", id="empty-start"),
+        pytest.param("bad:10", id="bad-start"),
+        pytest.param("10:bad", id="bad-end"),
+        pytest.param("20:10", id="end-smaller-than-start"),
+    ])
+    def test_range_invalid(self, bad):
         """
-        Tests ranges with a bad end value are invalid.
+        Tests that invalid ranges throw an error.
         """
         with pytest.raises(RangeValueError):
-            Range("10:bad")
+            Range(bad)
 
     def test_range_with_only_beginning(self):
         """
@@ -51,7 +48,7 @@ class TestRangeParsing(object):
         """
         instance = Range("10:")
         assert 10.0 == instance.start
-        assert float("inf") == instance.end
+        assert INF == instance.end
 
     def test_range_with_only_end(self):
         """
@@ -77,7 +74,7 @@ class TestRangeParsing(object):
         Tests that negative infinity is valid for start.
         """
         instance = Range("~:20")
-        assert float("-inf") == instance.start
+        assert NEG_INF == instance.start
         assert 20.0 == instance.end
         assert not instance.inclusive
 
@@ -87,17 +84,9 @@ class TestRangeParsing(object):
         """
         instance = Range("10:~")
         assert 10.0 == instance.start
-        assert float("inf") == instance.end
+        assert INF == instance.end
         assert not instance.inclusive
 
-    def test_range_with_end_smaller_than_start(self):
-        """
-        Tests that ranges which have an end larger than the start
-        are invalid.
-        """
-        with pytest.raises(RangeValueError):
-            Range("20:10")
-
     def test_range_with_equal_start_and_small(self):
         """
         Tests that the start and end can be equal.
@@ -107,6 +96,46 @@ class TestRangeParsing(object):
         assert 10.0 == instance.end
         assert not instance.inclusive
 
+    def test_parse_reuses_instances(self):
+        """
+        Tests that parsing the same range string twice returns the
+        same instance.
+        """
+        instance = Range.parse("@10:20")
+        assert instance is Range.parse("@10:20")
+        assert 10.0 == instance.start
+        assert 20.0 == instance.end
+        assert instance.inclusive
+
+    def test_range_is_immutable(self):
+        """
+        Tests that the values of a range cannot be changed.
+        """
+        instance = Range("10:20")
+        with pytest.raises(AttributeError):
+            instance.start = 15.0
+        with pytest.raises(AttributeError):
+            del instance.end
+
+    def test_range_equality(self):
+        """
+        Tests that ranges matching the same values are equal and
+        hash the same.
+        """
+        assert Range("10") == Range("0:10")
+        assert hash(Range("10")) == hash(Range("0:10"))
+        assert Range("10:20") != Range("@10:20")
+        assert Range("10:20") != "10:20"
+
+    def test_range_can_be_copied(self):
+        """
+        Tests that ranges survive copying and pickling.
+        """
+        instance = Range("@10:~")
+        assert instance == copy.copy(instance)
+        assert instance == copy.deepcopy(instance)
+        assert instance == pickle.loads(pickle.dumps(instance))
+
     def test_range_with_inclusive(self):
         """
         Tests that a range can be inclusive.
@@ -119,63 +148,76 @@ class TestRangeParsing(object):
 
 class TestRangeChecking(object):
 
-    def test_in_range_inclusive_equal_to_start(self):
+    def test_in_range_inclusive_equal_to_start(self, inclusive_range):
         """
         Tests that on inclusive ranges, values that are equal to
         the start are valid.
         """
-        instance = Range("@10:20")
-        assert instance.in_range(10)
+        assert inclusive_range.in_range(10)
 
-    def test_in_range_inclusive_equal_to_end(self):
+    def test_in_range_inclusive_equal_to_end(self, inclusive_range):
         """
         Tests that on inclusive ranges, values that are equal to
         the end are valid.
         """
-        instance = Range("@10:20")
-        assert instance.in_range(20)
+        assert inclusive_range.in_range(20)
 
-    def test_in_range_inclusive(self):
+    def test_in_range_inclusive(self, inclusive_range):
         """
         Tests that on inclusive ranges, values that are in the range
         are valid.
         """
-        instance = Range("@10:20")
-        assert instance.in_range(15)
+        assert inclusive_range.in_range(15)
 
-    def test_in_range_exclusive_equal_to_start_invalid(self):
+    def test_in_range_exclusive_equal_to_start_invalid(self, exclusive_range):
         """
         Tests that exclusive ranges do not count the start value.
         """
-        instance = Range("10:20")
-        assert not instance.in_range(10)
+        assert not exclusive_range.in_range(10)
 
-    def test_in_range_exclusive_equal_to_end_invalid(self):
+    def test_in_range_exclusive_equal_to_end_invalid(self, exclusive_range):
         """
         Tests that exclusive ranges do not count the end value.
         """
-        instance = Range("10:20")
-        assert not instance.in_range(20)
+        assert not exclusive_range.in_range(20)
 
-    def test_in_range_below_valid(self):
+    def test_in_range_below_valid(self, exclusive_range):
         """
         Tests that values outside the lower end of the range are valid.
         """
-        instance = Range("10:20")
-        assert instance.in_range(9)
+        assert exclusive_range.in_range(9)
 
-    def test_in_range_above_valid(self):
+    def test_in_range_above_valid(self, exclusive_range):
         """
         Tests that values outside the upper end of the range are valid.
         """
-        instance = Range("10:20")
-        assert instance.in_range(21)
+        assert exclusive_range.in_range(21)
+
+    def test_nan_is_never_in_range(self, inclusive_range, exclusive_range):
+        """
+        Tests that NaN does not match either an inclusive or an
+        exclusive range.
+        """
+        nan = float("nan")
+        assert not inclusive_range.in_range(nan)
+        assert not exclusive_range.in_range(nan)
+        assert [False] == inclusive_range.in_range_many([nan])
+        assert [False] == exclusive_range.in_range_many([nan])
+
+    def test_in_range_many(self, inclusive_range, exclusive_range):
+        """
+        Tests that a batch of values is checked the same way as
+        checking each value on its own.
+        """
+        values = [9, 10, 15, 20, 21]
+        for instance in [inclusive_range, exclusive_range]:
+            expected = [instance.in_range(v) for v in values]
+            assert expected == instance.in_range_many(values)
 
-    def test_range_as_string(self):
+    @pytest.mark.parametrize("value", ["10", "10:20", "20", "~:10", "@10:15", "@~:~", "10:~"])
+    def test_range_as_string(self, value):
         """
         Tests that the range can be converted back to a valid string
         format.
         """
-        tests = ["10", "10:20", "20", "~:10", "@10:15", "@~:~", "10:~"]
-        for test in tests:
-            assert test == str(Range(test))
+        assert value == str(Range(value))
@@ -3,18 +3,24 @@ Contains tests for the pycinga.Response class.
 """
 
 import sys
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 
-import pycinga
-from pycinga import Response
+from pycinga import OK, Response
+
+OK_NAME = OK.name
+OK_CODE = OK.exit_code
+
+EXPECTED_BLANK = f"{OK_NAME}:"
+EXPECTED_HI = f"{OK_NAME}: Hi"
+EXPECTED_PERF = f"{OK_NAME}: yo|users=20;;;; foos=80;;;;"
 
 
 class TestResponse(object):
 
     def test_status_gets_set_by_initializer(self):
         "Tests that the status can be set by the constructor."
-        instance = Response(pycinga.OK)
-        assert pycinga.OK == instance.status
+        instance = Response(OK)
+        assert OK == instance.status
 
     def test_message_gets_set_by_initializer(self):
         "Tests that the message can be set by the constructor."
@@ -26,29 +32,26 @@ class TestResponse(object):
         Tests that a response with no message given will not include
         anything in the output.
         """
-        instance = Response(pycinga.OK)
-        expected = "%s:" % pycinga.OK.name
-        assert expected == str(instance)
+        instance = Response(OK)
+        assert EXPECTED_BLANK == str(instance)
 
     def test_str_has_status_and_message(self):
         """
         Tests that without performance data, the status output
         will output the proper thing with status and a message.
         """
-        instance = Response(pycinga.OK, message="Hi")
-        expected = "%s: %s" % (pycinga.OK.name, "Hi")
-        assert expected == str(instance)
+        instance = Response(OK, message="Hi")
+        assert EXPECTED_HI == str(instance)
 
     def test_str_has_performance_data(self):
         """
         Tests that with performance data, the status output
         will output the value along with the performance data.
         """
-        instance = Response(pycinga.OK, message="yo")
+        instance = Response(OK, message="yo")
         instance.set_perf_data("users", 20)
         instance.set_perf_data("foos", 80)
-        expected = "%s: %s|users=20;;;; foos=80;;;;" % (pycinga.OK.name, "yo")
-        assert expected == str(instance)
+        assert EXPECTED_PERF == str(instance)
 
     def test_exit(self, monkeypatch):
         """
@@ -60,15 +63,26 @@ class TestResponse(object):
 
         mock_exit.exit_status = None
 
-        if sys.version_info[0] == 3:
-            output = StringIO()
-        else:
-            output = BytesIO()
+        output = StringIO()
         monkeypatch.setattr(sys, "stdout", output)
         monkeypatch.setattr(sys, "exit", mock_exit)
 
-        instance = Response(pycinga.OK)
+        instance = Response(OK)
         instance.exit()
 
-        assert pycinga.OK.exit_code == mock_exit.exit_status
-        assert "%s\n" % str(instance).encode() == output.getvalue()
+        assert OK_CODE == mock_exit.exit_status
+        assert EXPECTED_BLANK + "\n" == output.getvalue()
+
+    def test_exit_writes_utf8_to_buffer(self, monkeypatch):
+        """
+        Tests that responses are written as UTF-8 to the binary buffer
+        underneath stdout.
+        """
+        monkeypatch.setattr(sys, "exit", lambda code: None)
+
+        output = TextIOWrapper(BytesIO(), encoding="ascii")
+        monkeypatch.setattr(sys, "stdout", output)
+
+        Response(OK, message="caf\u00e9").exit()
+
+        assert "OK: caf\u00e9\n".encode("utf-8") == output.buffer.getvalue()
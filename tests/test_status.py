@@ -3,7 +3,12 @@ Contains tests to test the Status class, which is responsible for
 storing an Icinga exit status and corresponding message
 """
 
-from pycinga.status import Status
+import copy
+import pickle
+
+import pytest
+
+from pycinga.status import OK, Status
 
 
 class TestStatus(object):
@@ -13,9 +18,66 @@ class TestStatus(object):
         Tests __cmp__ operator of Status class
         """
 
-        a = Status("OK", 0)
-        b = Status("OK", 0)
+        a = Status("Test", 0)
+        b = Status("Test", 0)
         assert a == b
         assert a is not b
         assert Status("Test", 0) < Status("Test", 1)
         assert Status("Test", 1) > Status("Test", 0)
+        assert Status("Test", 0) <= Status("Test", 0)
+        assert Status("Test", 1) >= Status("Test", 0)
+        assert Status("Test", 0) != Status("Test", 1)
+        assert Status("Test", 0) != 0
+
+    def test_status_is_hashable(self):
+        """
+        Tests that statuses with the same exit code hash the same, so
+        they can be used as dict keys.
+        """
+        assert hash(Status("Test", 2)) == hash(Status("Other", 2))
+        assert 1 == len({Status("Test", 2), Status("Other", 2)})
+
+    def test_standard_status_is_reused(self):
+        """
+        Tests that creating a standard status returns the standard
+        status object itself.
+        """
+        assert Status("OK", 0) is OK
+        assert "OK" == OK.name
+        assert 0 == OK.exit_code
+
+    def test_invalid_types(self):
+        """
+        Tests that a non-int exit code or non-str name is rejected.
+        """
+        with pytest.raises(TypeError, match="exit_code must be an int, not str"):
+            Status("Test", "0")
+        with pytest.raises(TypeError, match="name must be a str, not int"):
+            Status(0, 0)
+
+    def test_repr(self):
+        """
+        Tests the repr of a status.
+        """
+        assert "Status(name='Test', exit_code=1)" == repr(Status("Test", 1))
+
+    def test_status_is_immutable(self):
+        """
+        Tests that the name and exit code cannot be changed.
+        """
+        instance = Status("Test", 1)
+        with pytest.raises(AttributeError):
+            instance.exit_code = 2
+        with pytest.raises(AttributeError):
+            OK.name = "Fine"
+
+    def test_status_can_be_copied(self):
+        """
+        Tests that statuses survive copying and pickling, and that the
+        standard statuses stay the standard objects.
+        """
+        instance = Status("Test", 1)
+        assert "Test" == copy.copy(instance).name
+        assert instance == pickle.loads(pickle.dumps(instance))
+        assert OK is copy.deepcopy(OK)
+        assert OK is pickle.loads(pickle.dumps(OK))